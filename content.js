@@ -1,11 +1,47 @@
 // Content script for LinkedIn Job Stats Extension
+const JOB_VIEW_ID_PATTERN = /\/jobs\/view\/(\d+)/;
+const JOB_POSTING_URN_PATTERN = /jobPosting:(\d+)/;
+const CARD_SCAN_INTERVAL_MS = 250;
+const MAX_CACHED_JOBS = 512;
+const RESPONSE_PARSE_TIMEOUT_MS = 500;
+
 class LinkedInJobStatsExtension {
   constructor() {
     this.jobData = new Map();
     this.processedJobs = new Set();
+    this.pendingScanNodes = new Set();
+    this.scanTimer = null;
+    this.pendingResponses = new Map();
+    this.parseScheduled = false;
+    this.placeholderTemplate = this.createTemplate(`
+      <div class="job-stats-content">
+        <div class="job-stats-loading">Loading stats...</div>
+      </div>
+    `);
+    this.statsTemplate = this.createTemplate(`
+      <div class="job-stats-row">
+        <span class="job-stat-item">L@: <span data-stat="listedAt"></span></span>
+        <span class="job-stat-divider">|</span>
+        <span class="job-stat-item">E@: <span data-stat="expireAt"></span></span>
+        <span class="job-stat-divider">|</span>
+        <span class="job-stat-item">OL@: <span data-stat="originalListedAt"></span></span>
+      </div>
+      <div class="job-stats-row">
+        <span class="job-stat-item">Views: <span data-stat="views"></span></span>
+        <span class="job-stat-divider">|</span>
+        <span class="job-stat-item">Applies: <span data-stat="applies"></span></span>
+      </div>
+    `);
     this.init();
   }
 
+  createTemplate(html) {
+    // Parsed once; cards are built by cloning instead of re-parsing markup
+    const template = document.createElement('template');
+    template.innerHTML = html;
+    return template;
+  }
+
   init() {
     // Inject script to intercept network requests
     this.injectNetworkInterceptor();
@@ -30,10 +66,25 @@ class LinkedInJobStatsExtension {
 
   handleJobData(data) {
     if (data.url && data.url.includes('voyager/api/jobs/jobPostings') && data.response) {
-      this.parseJobPostings(data.response);
+      // Keep only the latest response per URL; parsing waits for an idle period
+      this.pendingResponses.set(data.url, data.response);
+      this.scheduleResponseParse();
     }
   }
 
+  scheduleResponseParse() {
+    if (this.parseScheduled) return;
+    this.parseScheduled = true;
+
+    requestIdleCallback(() => {
+      this.parseScheduled = false;
+      const responses = this.pendingResponses;
+      this.pendingResponses = new Map();
+
+      responses.forEach(response => this.parseJobPostings(response));
+    }, { timeout: RESPONSE_PARSE_TIMEOUT_MS });
+  }
+
   parseJobPostings(response) {
     try {
       const data = JSON.parse(response);
@@ -46,7 +97,7 @@ class LinkedInJobStatsExtension {
           const jobId = job.jobPostingId || this.extractJobIdFromUrn(job.entityUrn);
           
           if (jobId) {
-            this.jobData.set(jobId, {
+            this.cacheJobData(jobId, {
               listedAt: this.convertTimestamp(job.listedAt),
               expireAt: this.convertTimestamp(job.expireAt),
               originalListedAt: this.convertTimestamp(job.originalListedAt),
@@ -64,9 +115,18 @@ class LinkedInJobStatsExtension {
     }
   }
 
+  cacheJobData(jobId, data) {
+    // Map keeps insertion order, so the first key is the least recently stored
+    this.jobData.delete(jobId);
+    if (this.jobData.size >= MAX_CACHED_JOBS) {
+      this.jobData.delete(this.jobData.keys().next().value);
+    }
+    this.jobData.set(jobId, data);
+  }
+
   extractJobIdFromUrn(urn) {
     if (!urn) return null;
-    const match = urn.match(/jobPosting:(\d+)/);
+    const match = JOB_POSTING_URN_PATTERN.exec(urn);
     return match ? match[1] : null;
   }
 
@@ -89,10 +149,14 @@ class LinkedInJobStatsExtension {
       mutations.forEach(mutation => {
         mutation.addedNodes.forEach(node => {
           if (node.nodeType === Node.ELEMENT_NODE) {
-            this.processJobCards(node);
+            this.pendingScanNodes.add(node);
           }
         });
       });
+
+      if (this.pendingScanNodes.size > 0) {
+        this.scheduleCardScan();
+      }
     });
 
     observer.observe(document.body, {
@@ -104,6 +168,23 @@ class LinkedInJobStatsExtension {
     this.processJobCards(document.body);
   }
 
+  scheduleCardScan() {
+    // Batch mutation bursts into at most one scan per interval
+    if (this.scanTimer !== null) return;
+
+    this.scanTimer = setTimeout(() => {
+      this.scanTimer = null;
+      const nodes = this.pendingScanNodes;
+      this.pendingScanNodes = new Set();
+
+      nodes.forEach(node => {
+        if (node.isConnected) {
+          this.processJobCards(node);
+        }
+      });
+    }, CARD_SCAN_INTERVAL_MS);
+  }
+
   processJobCards(container) {
     // LinkedIn job card selectors (may need adjustment based on current LinkedIn UI)
     const jobCardSelectors = [
@@ -142,7 +223,7 @@ class LinkedInJobStatsExtension {
     // Look for job ID in links
     const links = jobCard.querySelectorAll('a[href*="/jobs/view/"]');
     for (let link of links) {
-      const match = link.href.match(/\/jobs\/view\/(\d+)/);
+      const match = JOB_VIEW_ID_PATTERN.exec(link.href);
       if (match) return match[1];
     }
 
@@ -156,11 +237,7 @@ class LinkedInJobStatsExtension {
     statsContainer.className = 'job-stats-overlay';
     statsContainer.setAttribute('data-job-id', jobId);
     
-    statsContainer.innerHTML = `
-      <div class="job-stats-content">
-        <div class="job-stats-loading">Loading stats...</div>
-      </div>
-    `;
+    statsContainer.appendChild(this.placeholderTemplate.content.cloneNode(true));
 
     // Find the best place to insert stats
     const titleElement = jobCard.querySelector('h3, .job-card-list__title, [data-control-name="job_card_title"]');
@@ -180,20 +257,11 @@ class LinkedInJobStatsExtension {
 
     const content = statsElement.querySelector('.job-stats-content');
     if (content) {
-      content.innerHTML = `
-        <div class="job-stats-row">
-          <span class="job-stat-item">L@: ${data.listedAt}</span>
-          <span class="job-stat-divider">|</span>
-          <span class="job-stat-item">E@: ${data.expireAt}</span>
-          <span class="job-stat-divider">|</span>
-          <span class="job-stat-item">OL@: ${data.originalListedAt}</span>
-        </div>
-        <div class="job-stats-row">
-          <span class="job-stat-item">Views: ${data.views}</span>
-          <span class="job-stat-divider">|</span>
-          <span class="job-stat-item">Applies: ${data.applies}</span>
-        </div>
-      `;
+      const stats = this.statsTemplate.content.cloneNode(true);
+      stats.querySelectorAll('[data-stat]').forEach(field => {
+        field.textContent = data[field.dataset.stat];
+      });
+      content.replaceChildren(stats);
     }
   }
 }